@@ -87,7 +87,7 @@ struct WorkloadHash {
 /*! \brief The equality check for Workload */
 struct WorkloadEqual {
   bool operator()(const Workload& a, const Workload& b) const {
-    return a->shash == b->shash && tvm::StructuralEqual()(a->mod, b->mod);
+    return a.same_as(b) || (a->shash == b->shash && tvm::StructuralEqual()(a->mod, b->mod));
   }
 };
 
@@ -16,7 +16,7 @@
 # under the License.
 """Meta schedule integration with high-level IR"""
 from contextlib import contextmanager
-from typing import Callable, Dict, List, Optional, Union
+from typing import Callable, Dict, List, Optional, Tuple, Union
 
 from tvm._ffi import register_object
 from tvm.ir import IRModule, transform
@@ -272,6 +272,43 @@ def extract_task_from_relay(
     return env.tasks
 
 
+def normalize_module(mod: IRModule) -> IRModule:
+    """Normalize a module so that its only function is named "main".
+
+    Parameters
+    ----------
+    mod : IRModule
+        The module to normalize, which either has a function named "main" or a single function
+
+    Returns
+    -------
+    mod : IRModule
+        The normalized module
+    """
+    return _ffi_api.NormalizeModule(mod)  # type: ignore # pylint: disable=no-member
+
+
+def normalize_and_hash_tasks(tasks: List[ExtractedTask]) -> List[Tuple[IRModule, int]]:
+    """Normalize the dispatched module of each extracted task and compute its structural hash,
+    in a single FFI call.
+
+    Parameters
+    ----------
+    tasks : List[ExtractedTask]
+        The extracted tasks, each of which dispatches to exactly one module
+
+    Returns
+    -------
+    results : List[Tuple[IRModule, int]]
+        The normalized module, whose only function is named "main", and its structural hash,
+        one for each task
+    """
+    return [
+        (mod, int(shash))
+        for mod, shash in _ffi_api.NormalizeAndHashTasks(tasks)  # type: ignore # pylint: disable=no-member
+    ]
+
+
 def extract_task_from_relax(
     mod: Union[IRModule, RelaxFunc],
     target: Target,
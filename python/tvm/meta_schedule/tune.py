@@ -16,31 +16,45 @@
 # under the License.
 """User-facing Tuning API"""
 
+import hashlib
+import json
 import logging
 import os.path
-from typing import Callable, Dict, List, Optional, Union
+import threading
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Type, Union
 
 import tvm
 from tvm import relay
 from tvm._ffi.registry import register_func
 from tvm.relay import Function as RelayFunc
 from tvm.relay.backend.executor_factory import ExecutorFactoryModule
-from tvm.ir.base import structural_equal, structural_hash
+from tvm.ir.base import load_json, save_json, structural_equal, structural_hash
 from tvm.ir.module import IRModule
 from tvm.runtime import NDArray
 from tvm.target.target import Target
 from tvm.te import Tensor, create_prim_func
 from tvm.tir import PrimFunc, Schedule
+from tvm.tir.schedule import Instruction, Trace
 
-from .integration import extract_task_from_relay, ApplyHistoryBest
-from .builder import Builder, LocalBuilder
+from .integration import (
+    ApplyHistoryBest,
+    extract_task_from_relay,
+    normalize_and_hash_tasks,
+    normalize_module,
+)
+from . import measure_callback as ms_measure_callback
+from . import mutator as ms_mutator
+from . import postproc as ms_postproc
+from . import schedule_rule as ms_schedule_rule
+from .arg_info import ArgInfo
+from .builder import Builder, BuilderInput, LocalBuilder
 from .cost_model import CostModel, XGBModel
 from .database import Database, JSONDatabase, TuningRecord
 from .feature_extractor import PerStoreFeature
 from .measure_callback import MeasureCallback
 from .mutator import Mutator
 from .postproc import Postproc
-from .runner import LocalRunner, Runner
+from .runner import LocalRunner, Runner, RunnerInput
 from .schedule_rule import ScheduleRule
 from .search_strategy import (
     EvolutionarySearchConfig,
@@ -50,6 +64,7 @@ from .search_strategy import (
 from .space_generator import PostOrderApply, SpaceGenerator
 from .task_scheduler import RoundRobin, TaskScheduler
 from .tune_context import TuneContext
+from .utils import remove_build_dir
 
 
 logger = logging.getLogger(__name__)  # pylint: disable=invalid-name
@@ -81,12 +96,8 @@ class DefaultLLVM:
 
     @staticmethod
     def _sch_rules() -> List[ScheduleRule]:
-        from tvm.meta_schedule import (  # pylint: disable=import-outside-toplevel
-            schedule_rule as M,
-        )
-
         return [
-            M.AutoInline(
+            ms_schedule_rule.AutoInline(
                 into_producer=False,
                 into_consumer=True,
                 # into_cache_only=False, # TODO(@automation): Update the AutoInline
@@ -96,52 +107,44 @@ class DefaultLLVM:
                 require_ordered=True,
                 disallow_op=["tir.exp"],
             ),
-            M.AddRFactor(max_jobs_per_core=16, max_innermost_factor=64),
-            M.MultiLevelTiling(
+            ms_schedule_rule.AddRFactor(max_jobs_per_core=16, max_innermost_factor=64),
+            ms_schedule_rule.MultiLevelTiling(
                 structure="SSRSRS",
                 tile_binds=None,
                 max_innermost_factor=64,
                 vector_load_lens=None,
                 reuse_read=None,
-                reuse_write=M.ReuseType(
+                reuse_write=ms_schedule_rule.ReuseType(
                     req="may",
                     levels=[1, 2],
                     scope="global",
                 ),
             ),
-            M.ParallelizeVectorizeUnroll(
+            ms_schedule_rule.ParallelizeVectorizeUnroll(
                 max_jobs_per_core=16,
                 max_vectorize_extent=64,
                 unroll_max_steps=[0, 16, 64, 512],
                 unroll_explicit=True,
             ),
-            M.RandomComputeLocation(),
+            ms_schedule_rule.RandomComputeLocation(),
         ]
 
     @staticmethod
     def _postproc() -> List[Postproc]:
-        from tvm.meta_schedule import (  # pylint: disable=import-outside-toplevel
-            postproc as M,
-        )
-
         return [
-            M.DisallowDynamicLoop(),
-            M.RewriteParallelVectorizeUnroll(),
-            M.RewriteReductionBlock(),
+            ms_postproc.DisallowDynamicLoop(),
+            ms_postproc.RewriteParallelVectorizeUnroll(),
+            ms_postproc.RewriteReductionBlock(),
         ]
 
     @staticmethod
     def _mutator_probs() -> Dict[Mutator, float]:
-        from tvm.meta_schedule import (  # pylint: disable=import-outside-toplevel
-            mutator as M,
-        )
-
         return {
             # TODO(@automation): Upstream the mutators
-            # M.MutateTileSize(): 0.9,
-            M.MutateComputeLocation(): 0.05,
-            M.MutateUnroll(): 0.03,
-            # M.MutateParallel(max_jobs_per_core=16): 0.02,
+            # ms_mutator.MutateTileSize(): 0.9,
+            ms_mutator.MutateComputeLocation(): 0.05,
+            ms_mutator.MutateUnroll(): 0.03,
+            # ms_mutator.MutateParallel(max_jobs_per_core=16): 0.02,
         }
 
 
@@ -150,28 +153,24 @@ class DefaultCUDA:
 
     @staticmethod
     def _sch_rules() -> List[ScheduleRule]:
-        from tvm.meta_schedule import (  # pylint: disable=import-outside-toplevel
-            schedule_rule as M,
-        )
-
         return [
-            M.MultiLevelTiling(
+            ms_schedule_rule.MultiLevelTiling(
                 structure="SSSRRSRS",
                 tile_binds=["blockIdx.x", "vthread.x", "threadIdx.x"],
                 max_innermost_factor=64,
                 vector_load_lens=[1, 2, 3, 4],
-                reuse_read=M.ReuseType(
+                reuse_read=ms_schedule_rule.ReuseType(
                     req="must",
                     levels=[4],
                     scope="shared",
                 ),
-                reuse_write=M.ReuseType(
+                reuse_write=ms_schedule_rule.ReuseType(
                     req="must",
                     levels=[3],
                     scope="local",
                 ),
             ),
-            M.AutoInline(
+            ms_schedule_rule.AutoInline(
                 into_producer=True,
                 into_consumer=True,
                 # into_cache_only=False,
@@ -181,8 +180,8 @@ class DefaultCUDA:
                 require_ordered=False,
                 disallow_op=None,
             ),
-            M.CrossThreadReduction(thread_extents=[4, 8, 16, 32, 64, 128, 256, 512]),
-            M.ParallelizeVectorizeUnroll(
+            ms_schedule_rule.CrossThreadReduction(thread_extents=[4, 8, 16, 32, 64, 128, 256, 512]),
+            ms_schedule_rule.ParallelizeVectorizeUnroll(
                 max_jobs_per_core=-1,  # disable parallelize
                 max_vectorize_extent=-1,  # disable vectorize
                 unroll_max_steps=[0, 16, 64, 512, 1024],
@@ -192,32 +191,48 @@ class DefaultCUDA:
 
     @staticmethod
     def _postproc() -> List[Postproc]:
-        from tvm.meta_schedule import (  # pylint: disable=import-outside-toplevel
-            postproc as M,
-        )
-
         return [
-            M.DisallowDynamicLoop(),
+            ms_postproc.DisallowDynamicLoop(),
             # TODO(@automation): Upstream the RewriteCooperativeFetch postproc
-            # M.RewriteCooperativeFetch(),
-            M.RewriteUnboundBlock(),
-            M.RewriteParallelVectorizeUnroll(),
-            M.RewriteReductionBlock(),
-            M.VerifyGPUCode(),
+            # ms_postproc.RewriteCooperativeFetch(),
+            ms_postproc.RewriteUnboundBlock(),
+            ms_postproc.RewriteParallelVectorizeUnroll(),
+            ms_postproc.RewriteReductionBlock(),
+            ms_postproc.VerifyGPUCode(),
         ]
 
     @staticmethod
     def _mutator_probs() -> Dict[Mutator, float]:
-        from tvm.meta_schedule import (  # pylint: disable=import-outside-toplevel
-            mutator as M,
-        )
-
         return {
-            # M.MutateTileSize(): 0.9,
-            M.MutateUnroll(): 0.1,
+            # ms_mutator.MutateTileSize(): 0.9,
+            ms_mutator.MutateUnroll(): 0.1,
         }
 
 
+# The default builder and runner, shared across tuning calls so that their worker pools are reused
+_DEFAULT_BUILDER: Optional[LocalBuilder] = None
+_DEFAULT_RUNNER: Optional[LocalRunner] = None
+_DEFAULT_LOCK = threading.Lock()
+
+
+def shutdown_defaults() -> None:
+    """Release the default LocalBuilder and LocalRunner shared across tuning calls,
+    together with their worker processes."""
+    global _DEFAULT_BUILDER, _DEFAULT_RUNNER  # pylint: disable=global-statement,invalid-name
+    with _DEFAULT_LOCK:
+        _DEFAULT_BUILDER = None
+        _DEFAULT_RUNNER = None
+
+
+TypeDefaultConfig = Union[Type[DefaultLLVM], Type[DefaultCUDA]]
+
+# The default tuning configuration of each target kind
+_DEFAULT_CONFIGS: Dict[str, TypeDefaultConfig] = {
+    "llvm": DefaultLLVM,
+    "cuda": DefaultCUDA,
+}
+
+
 class Parse:
     """Parse tuning configuration from user inputs."""
 
@@ -232,16 +247,12 @@ class Parse:
             raise TypeError(f"Expected `mod` to be PrimFunc or IRModule, but gets: {mod}")
         # in order to make sure the mod can be found in ApplyHistoryBest
         # different func name can cause structural unequal
-        func_names = mod.get_global_vars()
-        (func_name,) = func_names
-        if len(func_names) == 1 and func_name != "main":
-            mod = IRModule({"main": mod[func_name]})
-        return mod
+        return normalize_module(mod)
 
     @staticmethod
     def _target(target: Union[str, Target]) -> Target:
         if isinstance(target, str):
-            target = Target(target)
+            return Target(target)
         if not isinstance(target, Target):
             raise TypeError(f"Expected `target` to be str or Target, but gets: {target}")
         return target
@@ -249,7 +260,11 @@ class Parse:
     @staticmethod
     def _builder(builder: Optional[Builder]) -> Builder:
         if builder is None:
-            builder = LocalBuilder()
+            global _DEFAULT_BUILDER  # pylint: disable=global-statement,invalid-name
+            with _DEFAULT_LOCK:
+                if _DEFAULT_BUILDER is None:
+                    _DEFAULT_BUILDER = LocalBuilder()
+                return _DEFAULT_BUILDER
         if not isinstance(builder, Builder):
             raise TypeError(f"Expected `builder` to be Builder, but gets: {builder}")
         return builder
@@ -257,7 +272,11 @@ class Parse:
     @staticmethod
     def _runner(runner: Optional[Runner]) -> Runner:
         if runner is None:
-            runner = LocalRunner()
+            global _DEFAULT_RUNNER  # pylint: disable=global-statement,invalid-name
+            with _DEFAULT_LOCK:
+                if _DEFAULT_RUNNER is None:
+                    _DEFAULT_RUNNER = LocalRunner()
+                return _DEFAULT_RUNNER
         if not isinstance(runner, Runner):
             raise TypeError(f"Expected `runner` to be Runner, but gets: {runner}")
         return runner
@@ -272,7 +291,7 @@ class Parse:
                 path_workload,
                 path_tuning_record,
             )
-            database = JSONDatabase(
+            return JSONDatabase(
                 path_workload=path_workload,
                 path_tuning_record=path_tuning_record,
             )
@@ -285,15 +304,11 @@ class Parse:
         measure_callbacks: Optional[List[MeasureCallback]],
     ) -> List[MeasureCallback]:
         if measure_callbacks is None:
-            from tvm.meta_schedule import (  # pylint: disable=import-outside-toplevel
-                measure_callback as M,
-            )
-
             return [
-                M.AddToDatabase(),
-                M.RemoveBuildArtifact(),
-                M.EchoStatistics(),
-                M.UpdateCostModel(),
+                ms_measure_callback.AddToDatabase(),
+                ms_measure_callback.RemoveBuildArtifact(),
+                ms_measure_callback.EchoStatistics(),
+                ms_measure_callback.UpdateCostModel(),
             ]
         if not isinstance(measure_callbacks, (list, tuple)):
             raise TypeError(
@@ -330,19 +345,20 @@ class Parse:
             )
         return space_generator
 
+    @staticmethod
+    def _default_config(target: Target) -> TypeDefaultConfig:
+        default_config = _DEFAULT_CONFIGS.get(target.kind.name, None)
+        if default_config is None:
+            raise ValueError(f"Unsupported target: {target}")
+        return default_config
+
     @staticmethod
     def _sch_rules(sch_rules: Optional[TypeScheduleRule], target: Target) -> List[ScheduleRule]:
         if callable(sch_rules):
             return sch_rules()
         if sch_rules is not None:
             raise TypeError(f"Expected `sch_rules` to be None or callable, but gets: {sch_rules}")
-        # pylint: disable=protected-access
-        if target.kind.name == "llvm":
-            return DefaultLLVM._sch_rules()
-        if target.kind.name == "cuda":
-            return DefaultCUDA._sch_rules()
-        # pylint: enable=protected-access
-        raise ValueError(f"Unsupported target: {target}")
+        return Parse._default_config(target)._sch_rules()  # pylint: disable=protected-access
 
     @staticmethod
     def _postproc(postproc: Optional[TypePostproc], target: Target) -> List[Postproc]:
@@ -350,13 +366,7 @@ class Parse:
             return postproc()
         if postproc is not None:
             raise TypeError(f"Expected `postproc` to be None or callable, but gets: {postproc}")
-        # pylint: disable=protected-access
-        if target.kind.name == "llvm":
-            return DefaultLLVM._postproc()
-        if target.kind.name == "cuda":
-            return DefaultCUDA._postproc()
-        # pylint: enable=protected-access
-        raise ValueError(f"Unsupported target: {target}")
+        return Parse._default_config(target)._postproc()  # pylint: disable=protected-access
 
     @staticmethod
     def _mutator_probs(
@@ -369,13 +379,7 @@ class Parse:
             raise TypeError(
                 f"Expected `mutator_probs` to be None or callable, but gets: {mutator_probs}"
             )
-        # pylint: disable=protected-access
-        if target.kind.name == "llvm":
-            return DefaultLLVM._mutator_probs()
-        if target.kind.name == "cuda":
-            return DefaultCUDA._mutator_probs()
-        # pylint: enable=protected-access
-        raise ValueError(f"Unsupported target: {target}")
+        return Parse._default_config(target)._mutator_probs()  # pylint: disable=protected-access
 
     @staticmethod
     def _tune_context(
@@ -444,6 +448,186 @@ class Parse:
         return task_scheduler
 
 
+def _tasks_cache_key(
+    mod: Union[RelayFunc, IRModule],
+    target: Target,
+    params: Optional[Dict[str, NDArray]],
+) -> str:
+    """Hash the inputs of task extraction, used to validate the task cache of tune_relay."""
+    sha = hashlib.sha256()
+    sha.update(tvm.__version__.encode("utf-8"))
+    sha.update(str(target).encode("utf-8"))
+    sha.update(save_json(mod).encode("utf-8"))
+    if params:
+        for name in sorted(params):
+            sha.update(name.encode("utf-8"))
+            sha.update(params[name].numpy())
+    return sha.hexdigest()
+
+
+def _load_tasks(path: str, key: str) -> Optional[List[Tuple[str, IRModule]]]:
+    """Load the cached (task_name, mod) pairs, or None if the cache is missing or stale."""
+    if not os.path.isfile(path):
+        return None
+    try:
+        with open(path, "r", encoding="utf-8") as i_f:
+            cache = json.load(i_f)
+        if cache["key"] != key:
+            return None
+        return [(name, load_json(mod)) for name, mod in cache["tasks"]]
+    except (OSError, ValueError, KeyError, TypeError, tvm.TVMError):
+        logger.warning("Ignoring invalid task cache: %s", path)
+        return None
+
+
+def _save_tasks(path: str, key: str, tasks: List[Tuple[str, IRModule]]) -> None:
+    """Save the (task_name, mod) pairs to the task cache."""
+    cache = {"key": key, "tasks": [(name, save_json(mod)) for name, mod in tasks]}
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as o_f:
+        json.dump(cache, o_f)
+    os.replace(tmp_path, path)
+
+
+def _neighbor_decisions(inst: Instruction, decision: Any) -> List[Any]:
+    """The decisions one step away from the given decision of a sampling instruction.
+
+    For SamplePerfectTile, a step moves the smallest prime factor of one tile to another tile, which
+    keeps the product of the tiles unchanged. For SampleCategorical, a step moves to an adjacent
+    candidate. Other sampling instructions are left untouched.
+    """
+    kind = inst.kind.name
+    if kind == "SamplePerfectTile":
+        max_innermost_factor = int(inst.attrs[1])
+        tiles = [int(factor) for factor in decision]
+        results = []
+        for i, factor in enumerate(tiles):
+            prime = next((p for p in range(2, factor + 1) if factor % p == 0), None)
+            if prime is None:
+                continue
+            for j in range(len(tiles)):
+                if i == j:
+                    continue
+                new_tiles = list(tiles)
+                new_tiles[i] //= prime
+                new_tiles[j] *= prime
+                if max_innermost_factor <= 0 or new_tiles[-1] <= max_innermost_factor:
+                    results.append(new_tiles)
+        return results
+    if kind == "SampleCategorical":
+        num_candidates = len(inst.attrs[0])
+        decision = int(decision)
+        return [d for d in (decision - 1, decision + 1) if 0 <= d < num_candidates]
+    return []
+
+
+def _replay_trace(context: TuneContext, trace: Trace) -> Optional[Schedule]:
+    """Replay a trace without its postprocessing on the task, then apply the postprocessors."""
+    sch = Schedule(context.mod)
+    try:
+        trace.apply_to_schedule(sch, remove_postproc=True)
+    except tvm.TVMError:
+        return None
+    sch.enter_postproc()
+    for postproc in context.postprocs:
+        if not postproc.apply(sch):
+            return None
+    return sch
+
+
+def _droplet_refine(
+    context: TuneContext,
+    builder: Builder,
+    runner: Runner,
+    database: Database,
+    top_k: int = 5,
+    max_rounds: int = 8,
+) -> None:
+    """Refine the best tuning records of a tuned task with a Droplet-style coordinate descent.
+
+    Starting from each of the top-k records in the database, the decisions of the sampling
+    instructions are moved one step at a time. All the neighbors of the current best trace are
+    measured together, and the search moves to the fastest neighbor until none of them improves.
+    Every measured candidate is committed to the database, and a schedule already visited while
+    refining the task is never measured again.
+
+    Parameters
+    ----------
+    context : TuneContext
+        The tuned task, whose postprocessors are already initialized.
+    builder : Builder
+        The builder to use.
+    runner : Runner
+        The runner to use.
+    database : Database
+        The database to read the tuning records from and commit the new ones to.
+    top_k : int
+        The number of tuning records to start the descent from.
+    max_rounds : int
+        The maximum number of descent steps from each tuning record.
+    """
+    target = context.target
+    workload = database.commit_workload(context.mod)
+    args_info = ArgInfo.from_prim_func(context.mod["main"])
+    visited: Set[int] = set()
+    for record in database.get_top_k(workload, top_k):
+        start = _replay_trace(context, record.trace)
+        if start is None:
+            # the neighbors of a trace that cannot be replayed are unlikely to replay either
+            continue
+        start_hash = structural_hash(start.mod)
+        if start_hash in visited:
+            continue
+        visited.add(start_hash)
+        best_trace = record.trace
+        best_cost = sum(float(sec) for sec in record.run_secs) / len(record.run_secs)
+        for _ in range(max_rounds):
+            candidates: List[Schedule] = []
+            for inst, decision in best_trace.decisions.items():
+                for new_decision in _neighbor_decisions(inst, decision):
+                    sch = _replay_trace(
+                        context,
+                        best_trace.with_decision(inst, new_decision, remove_postproc=True),
+                    )
+                    if sch is None:
+                        continue
+                    sch_hash = structural_hash(sch.mod)
+                    if sch_hash not in visited:
+                        visited.add(sch_hash)
+                        candidates.append(sch)
+            if not candidates:
+                break
+            logger.info("Droplet refinement: measuring %d neighbors", len(candidates))
+            builder_results = builder.build(
+                [BuilderInput(sch.mod, target) for sch in candidates],
+            )
+            runner_inputs = []
+            built: List[Schedule] = []
+            for sch, builder_result in zip(candidates, builder_results):
+                if builder_result.error_msg is None:
+                    runner_inputs.append(
+                        RunnerInput(builder_result.artifact_path, target.kind.name, args_info)
+                    )
+                    built.append(sch)
+            runner_results = [future.result() for future in runner.run(runner_inputs)]
+            for builder_result in builder_results:
+                if builder_result.artifact_path is not None:
+                    remove_build_dir(builder_result.artifact_path)
+            improved = False
+            for sch, runner_result in zip(built, runner_results):
+                if runner_result.error_msg is not None:
+                    continue
+                run_secs = [float(sec) for sec in runner_result.run_secs]
+                database.commit_tuning_record(
+                    TuningRecord(sch.trace, run_secs, workload, target, args_info)
+                )
+                cost = sum(run_secs) / len(run_secs)
+                if cost < best_cost:
+                    best_trace, best_cost, improved = sch.trace, cost, True
+            if not improved:
+                break
+
+
 def tune_tir(
     mod: Union[IRModule, PrimFunc],
     target: Union[str, Target],
@@ -462,6 +646,9 @@ def tune_tir(
     postprocs: Optional[TypePostproc] = None,
     mutator_probs: Optional[TypeMutatorProb] = None,
     num_threads: Optional[int] = None,
+    post_optimize: bool = False,
+    post_optimize_top_k: int = 5,
+    post_optimize_max_rounds: int = 8,
 ) -> Optional[Schedule]:
     """Tune a TIR IRModule with a given target.
 
@@ -478,9 +665,11 @@ def tune_tir(
     work_dir : Optional[str]
         The working directory to save intermediate results.
     builder : Optional[Builder]
-        The builder to use.
+        The builder to use. If None, a LocalBuilder shared across tuning calls is used, whose
+        worker processes outlive this call until `shutdown_defaults` is called.
     runner : Optional[Runner]
-        The runner to use.
+        The runner to use. If None, a LocalRunner shared across tuning calls is used, whose
+        worker processes outlive this call until `shutdown_defaults` is called.
     database : Optional[Database]
         The database to use.
     cost_model : Optional[CostModel]
@@ -491,6 +680,13 @@ def tune_tir(
         The function to create TuneContext.
     f_task_scheduler : Optional[TYPE_F_TASK_SCHEDULER]
         The function to create TaskScheduler.
+    post_optimize : bool
+        Whether to refine the best tuning records with a Droplet-style coordinate descent over
+        the sampling decisions after tuning.
+    post_optimize_top_k : int
+        The number of best tuning records of each task to refine from.
+    post_optimize_max_rounds : int
+        The maximum number of descent steps from each refined tuning record.
 
     Returns
     -------
@@ -514,17 +710,28 @@ def tune_tir(
         mutator_probs=mutator_probs,
         num_threads=num_threads,
     )
+    builder = Parse._builder(builder)
+    runner = Parse._runner(runner)
     task_scheduler = Parse._task_scheduler(
         task_scheduler,
         [tune_context],
-        builder=Parse._builder(builder),
-        runner=Parse._runner(runner),
+        builder=builder,
+        runner=runner,
         database=database,
         cost_model=Parse._cost_model(cost_model),
         measure_callbacks=Parse._callbacks(measure_callbacks),
     )
     # pylint: enable=protected-access
     task_scheduler.tune()
+    if post_optimize:
+        _droplet_refine(
+            tune_context,
+            builder,
+            runner,
+            database,
+            top_k=post_optimize_top_k,
+            max_rounds=post_optimize_max_rounds,
+        )
     bests: List[TuningRecord] = database.get_top_k(
         database.commit_workload(mod),
         top_k=1,
@@ -556,6 +763,9 @@ def tune_te(
     postprocs: Optional[TypePostproc] = None,
     mutator_probs: Optional[TypeMutatorProb] = None,
     num_threads: Optional[int] = None,
+    post_optimize: bool = False,
+    post_optimize_top_k: int = 5,
+    post_optimize_max_rounds: int = 8,
 ) -> Optional[Schedule]:
     """Tune a TE compute DAG with a given target.
 
@@ -572,9 +782,11 @@ def tune_te(
     work_dir : Optional[str]
         The working directory to save intermediate results.
     builder : Optional[Builder]
-        The builder to use.
+        The builder to use. If None, a LocalBuilder shared across tuning calls is used, whose
+        worker processes outlive this call until `shutdown_defaults` is called.
     runner : Optional[Runner]
-        The runner to use.
+        The runner to use. If None, a LocalRunner shared across tuning calls is used, whose
+        worker processes outlive this call until `shutdown_defaults` is called.
     database : Optional[Database]
         The database to use.
     measure_callbacks : Optional[List[MeasureCallback]]
@@ -583,6 +795,13 @@ def tune_te(
         The function to create TuneContext.
     f_task_scheduler : Optional[TYPE_F_TASK_SCHEDULER]
         The function to create TaskScheduler.
+    post_optimize : bool
+        Whether to refine the best tuning records with a Droplet-style coordinate descent over
+        the sampling decisions after tuning.
+    post_optimize_top_k : int
+        The number of best tuning records of each task to refine from.
+    post_optimize_max_rounds : int
+        The maximum number of descent steps from each refined tuning record.
 
     Returns
     -------
@@ -606,6 +825,9 @@ def tune_te(
         postprocs=postprocs,
         mutator_probs=mutator_probs,
         num_threads=num_threads,
+        post_optimize=post_optimize,
+        post_optimize_top_k=post_optimize_top_k,
+        post_optimize_max_rounds=post_optimize_max_rounds,
     )
 
 
@@ -628,6 +850,10 @@ def tune_relay(
     postprocs: Optional[TypePostproc] = None,
     mutator_probs: Optional[TypeMutatorProb] = None,
     num_threads: Optional[int] = None,
+    post_optimize: bool = False,
+    post_optimize_top_k: int = 5,
+    post_optimize_max_rounds: int = 8,
+    cache_tasks: bool = False,
 ) -> ExecutorFactoryModule:
     """Tune a TIR IRModule with a given target.
 
@@ -646,9 +872,11 @@ def tune_relay(
     work_dir : Optional[str]
         The working directory to save intermediate results.
     builder : Optional[Builder]
-        The builder to use.
+        The builder to use. If None, a LocalBuilder shared across tuning calls is used, whose
+        worker processes outlive this call until `shutdown_defaults` is called.
     runner : Optional[Runner]
-        The runner to use.
+        The runner to use. If None, a LocalRunner shared across tuning calls is used, whose
+        worker processes outlive this call until `shutdown_defaults` is called.
     database : Optional[Database]
         The database to use.
     measure_callbacks : Optional[List[MeasureCallback]]
@@ -657,6 +885,18 @@ def tune_relay(
         The function to create TuneContext.
     f_task_scheduler : Optional[TYPE_F_TASK_SCHEDULER]
         The function to create TaskScheduler.
+    post_optimize : bool
+        Whether to refine the best tuning records with a Droplet-style coordinate descent over
+        the sampling decisions after tuning.
+    post_optimize_top_k : int
+        The number of best tuning records of each task to refine from.
+    post_optimize_max_rounds : int
+        The maximum number of descent steps from each refined tuning record.
+    cache_tasks : bool
+        Whether to cache the deduplicated tasks in the working directory and reuse them on the next
+        call with the same inputs. The cache is keyed only by the TVM version string, the target,
+        the module and the params, so a rebuild of TVM or an edit to its TOPI strategies that
+        changes the extracted tasks is not detected, and stale tasks are reused. Off by default.
 
     Returns
     -------
@@ -665,57 +905,86 @@ def tune_relay(
     """
 
     logger.info("Working directory: %s", work_dir)
-    extracted_tasks = extract_task_from_relay(mod, target, params)
     # pylint: disable=protected-access
-    tune_contexts = []
     target = Parse._target(target)
     database = Parse._database(database, task_name, work_dir)
+    # resolve the target-specific defaults once instead of per task. The factories are still
+    # invoked per task, because each TuneContext initializes its own rules, postprocs and mutators
+    if sch_rules is None:
+        sch_rules = Parse._default_config(target)._sch_rules
+    if postprocs is None:
+        postprocs = Parse._default_config(target)._postproc
+    if mutator_probs is None:
+        mutator_probs = Parse._default_config(target)._mutator_probs
+    # reuse the deduplicated tasks of a previous run on the same inputs, if any
+    tasks_path = os.path.join(work_dir, f"{task_name}_tasks.json")
+    tasks_key = _tasks_cache_key(mod, target, params) if cache_tasks else None
+    extracted_tasks = _load_tasks(tasks_path, tasks_key) if cache_tasks else None
+    if extracted_tasks is None:
+        # deduplicate the extracted tasks before any TuneContext is constructed
+        extracted_tasks = []
+        buckets: Dict[int, List[IRModule]] = {}
+        relay_tasks = extract_task_from_relay(mod, target, params)
+        num_tasks = len(relay_tasks)
+        for task, (task_mod, task_hash) in zip(relay_tasks, normalize_and_hash_tasks(relay_tasks)):
+            bucket = buckets.setdefault(task_hash, [])
+            if not any(structural_equal(task_mod, other_mod) for other_mod in bucket):
+                bucket.append(task_mod)
+                extracted_tasks.append((task.task_name, task_mod))
+        logger.info(
+            "Task deduplication: %d tasks before, %d tasks after",
+            num_tasks,
+            len(extracted_tasks),
+        )
+        if cache_tasks:
+            try:
+                _save_tasks(tasks_path, tasks_key, extracted_tasks)
+            except OSError:
+                logger.warning("Failed to save the task cache: %s", tasks_path, exc_info=True)
+    else:
+        logger.warning("Reusing %d cached tasks from: %s", len(extracted_tasks), tasks_path)
+
     # parse the tuning contexts
-    for task in extracted_tasks:
-        assert len(task.dispatched) == 1, "Only size 1 dispatched task list is supported for now"
-        tune_contexts.append(
-            Parse._tune_context(
-                tune_context=None,
-                mod=Parse._mod(task.dispatched[0]),
-                target=target,
-                config=config,
-                task_name=task.task_name,
-                space_generator=space,
-                sch_rules=sch_rules,
-                postprocs=postprocs,
-                mutator_probs=mutator_probs,
-                num_threads=num_threads,
-            )
+    tasks: List[TuneContext] = [
+        Parse._tune_context(
+            tune_context=None,
+            mod=task_mod,
+            target=target,
+            config=config,
+            task_name=name,
+            space_generator=space,
+            sch_rules=sch_rules,
+            postprocs=postprocs,
+            mutator_probs=mutator_probs,
+            num_threads=num_threads,
         )
-    # deduplication
-    logger.info("Before task deduplication: %d tasks", len(tune_contexts))
-    tasks: List[TuneContext] = []
-    hashs: List[int] = []
-    for i, task in enumerate(tune_contexts):
-        struct_hash: int = structural_hash(task.mod)
-        flag: bool = False
-        if struct_hash in hashs:
-            for other_task in tune_contexts[i + 1 :]:
-                if structural_equal(task.mod, other_task.mod):
-                    flag = True
-                    break
-        if not flag:
-            tasks.append(task)
-            hashs.append(struct_hash)
-    logger.info("After task deduplication: %d tasks", len(tasks))
+        for name, task_mod in extracted_tasks
+    ]
 
     # parse the task scheduler
+    builder = Parse._builder(builder)
+    runner = Parse._runner(runner)
     task_scheduler = Parse._task_scheduler(
         task_scheduler,
         tasks,
-        builder=Parse._builder(builder),
-        runner=Parse._runner(runner),
+        builder=builder,
+        runner=runner,
         database=database,
         cost_model=Parse._cost_model(cost_model),
         measure_callbacks=Parse._callbacks(measure_callbacks),
     )
     # pylint: enable=protected-access
     task_scheduler.tune()
+    if post_optimize:
+        for task in tasks:
+            _droplet_refine(
+                task,
+                builder,
+                runner,
+                database,
+                top_k=post_optimize_top_k,
+                max_rounds=post_optimize_max_rounds,
+            )
     with ApplyHistoryBest(database):
         with tvm.transform.PassContext(
             opt_level=3,
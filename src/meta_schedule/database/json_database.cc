@@ -18,6 +18,7 @@
  */
 #include <set>
 #include <unordered_map>
+#include <vector>
 
 #include "../utils.h"
 
@@ -55,8 +56,10 @@ class JSONDatabaseNode : public DatabaseNode {
   String path_tuning_record;
   /*! \brief All the workloads in the database */
   std::unordered_map<Workload, int, WorkloadHash, WorkloadEqual> workloads2idx_;
-  /*! \brief All the tuning records in the database */
-  std::multiset<TuningRecord, SortTuningRecordByMeanRunSecs> tuning_records_;
+  /*! \brief All the tuning records in the database, indexed by the workload index */
+  std::vector<std::multiset<TuningRecord, SortTuningRecordByMeanRunSecs>> tuning_records_;
+  /*! \brief The number of tuning records in the database */
+  int64_t num_tuning_records_ = 0;
 
   void VisitAttrs(tvm::AttrVisitor* v) {
     v->Visit("path_workload", &path_workload);
@@ -82,17 +85,21 @@ class JSONDatabaseNode : public DatabaseNode {
     Workload workload = it->first;
     // If `mod` is new in `workloads2idx_`, append it to the workload file
     if (inserted) {
-      it->second = static_cast<int>(this->workloads2idx_.size()) - 1;
+      // The index is the line of the workload file, which may hold duplicated workloads
+      it->second = static_cast<int>(this->tuning_records_.size());
+      this->tuning_records_.emplace_back();
       JSONFileAppendLine(this->path_workload, JSONObj2Str(workload->AsJSON()));
     }
     return it->first;
   }
 
   void CommitTuningRecord(const TuningRecord& record) {
-    this->tuning_records_.insert(record);
+    int workload_index = this->workloads2idx_.at(record->workload);
+    this->tuning_records_[workload_index].insert(record);
+    ++this->num_tuning_records_;
     JSONFileAppendLine(this->path_tuning_record,
                        JSONObj2Str(Array<ObjectRef>{
-                           /*workload_index=*/Integer(this->workloads2idx_.at(record->workload)),
+                           /*workload_index=*/Integer(workload_index),
                            /*tuning_record=*/record->AsJSON()  //
                        }));
   }
@@ -102,21 +109,23 @@ class JSONDatabaseNode : public DatabaseNode {
     if (top_k == 0) {
       return {};
     }
+    auto it = this->workloads2idx_.find(workload);
+    if (it == this->workloads2idx_.end()) {
+      return {};
+    }
     Array<TuningRecord> results;
     results.reserve(top_k);
     int counter = 0;
-    for (const TuningRecord& record : this->tuning_records_) {
-      if (WorkloadEqual()(record->workload, workload)) {
-        results.push_back(record);
-        if (++counter == top_k) {
-          break;
-        }
+    for (const TuningRecord& record : this->tuning_records_[it->second]) {
+      results.push_back(record);
+      if (++counter == top_k) {
+        break;
       }
     }
     return results;
   }
 
-  int64_t Size() { return tuning_records_.size(); }
+  int64_t Size() { return num_tuning_records_; }
 };
 
 Database Database::JSONDatabase(String path_workload, String path_tuning_record,
@@ -131,9 +140,11 @@ Database Database::JSONDatabase(String path_workload, String path_tuning_record,
     workloads.reserve(n_objs);
     for (int i = 0; i < n_objs; ++i) {
       Workload workload = Workload::FromJSON(json_objs[i]);
-      n->workloads2idx_.emplace(workload, i);
-      workloads.push_back(workload);
+      // Duplicated workloads in the file share the index of their first occurrence
+      auto it = n->workloads2idx_.emplace(workload, i).first;
+      workloads.push_back(it->first);
     }
+    n->tuning_records_.resize(n_objs);
   }
   // Load `n->tuning_records_` from `path_tuning_record`
   {
@@ -150,7 +161,10 @@ Database Database::JSONDatabase(String path_workload, String path_tuning_record,
         LOG(FATAL) << "ValueError: Unable to parse the JSON object: " << json_obj
                    << "\nThe error is: " << e.what();
       }
-      n->tuning_records_.insert(TuningRecord::FromJSON(tuning_record, workloads[workload_index]));
+      const Workload& workload = workloads[workload_index];
+      n->tuning_records_[n->workloads2idx_.at(workload)].insert(
+          TuningRecord::FromJSON(tuning_record, workload));
+      ++n->num_tuning_records_;
     }
   }
   n->path_workload = path_workload;
@@ -137,6 +137,44 @@ Optional<ObjectRef> ApplyHistoryBestNode::Query(runtime::String task_name, IRMod
   return NullOpt;
 }
 
+/**************** Task normalization ****************/
+
+/*!
+ * \brief Normalize a module so that its only function is named "main", in order to make sure the
+ * module can be found in ApplyHistoryBest, since a different function name makes it structurally
+ * unequal. It backs `tvm.meta_schedule.tune.Parse._mod`.
+ * \param mod The module to normalize
+ * \return The normalized module
+ */
+IRModule NormalizeModule(IRModule mod) {
+  if (mod->ContainGlobalVar("main")) {
+    return mod;
+  }
+  CHECK_EQ(mod->functions.size(), 1)
+      << "ValueError: Expect a single function in the module, but gets: " << mod;
+  BaseFunc func = (*mod->functions.begin()).second;
+  return IRModule(Map<GlobalVar, BaseFunc>({{GlobalVar("main"), func}}));
+}
+
+/*!
+ * \brief Normalize the dispatched module of each extracted task with `NormalizeModule`, and
+ * compute its structural hash
+ * \param tasks The extracted tasks
+ * \return A list of (normalized module, structural hash) pairs, one for each task
+ */
+Array<Array<ObjectRef>> NormalizeAndHashTasks(const Array<ExtractedTask>& tasks) {
+  Array<Array<ObjectRef>> results;
+  results.reserve(tasks.size());
+  for (const ExtractedTask& task : tasks) {
+    CHECK_EQ(task->dispatched.size(), 1)
+        << "ValueError: Only size 1 dispatched task list is supported for now";
+    IRModule mod = NormalizeModule(task->dispatched[0]);
+    int64_t shash = static_cast<int64_t>(tvm::StructuralHash()(mod));
+    results.push_back(Array<ObjectRef>{mod, IntImm(DataType::Int(64), shash)});
+  }
+  return results;
+}
+
 /**************** FFI ****************/
 
 class MetaScheduleContextInternal {
@@ -168,6 +206,8 @@ TVM_REGISTER_GLOBAL("meta_schedule.MetaScheduleContextQuery")
 TVM_REGISTER_GLOBAL("meta_schedule.TaskExtraction").set_body_typed([]() -> TaskExtraction {
   return TaskExtraction();
 });
+TVM_REGISTER_GLOBAL("meta_schedule.NormalizeModule").set_body_typed(NormalizeModule);
+TVM_REGISTER_GLOBAL("meta_schedule.NormalizeAndHashTasks").set_body_typed(NormalizeAndHashTasks);
 TVM_REGISTER_GLOBAL("meta_schedule.ApplyHistoryBest")
     .set_body_typed([](Database database) -> ApplyHistoryBest {
       return ApplyHistoryBest(database);
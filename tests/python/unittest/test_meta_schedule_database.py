@@ -295,5 +295,42 @@ def test_meta_schedule_database_reload():
             _equal_record(ret[1], records[2])
 
 
+def test_meta_schedule_database_reload_duplicated_workloads():
+    mod: IRModule = Matmul
+    mod_2: IRModule = MatmulRelu
+    with tempfile.TemporaryDirectory() as tmpdir:
+        database = _create_tmp_database(tmpdir)
+        workload = database.commit_workload(mod)
+        record = TuningRecord(
+            _create_schedule(mod, _schedule_matmul).trace,
+            [1.5, 2.5, 1.8],
+            workload,
+            tvm.target.Target("llvm"),
+            ArgInfo.from_prim_func(func=mod["main"]),  # pylint: disable=unsubscriptable-object
+        )
+        database.commit_tuning_record(record)
+        # duplicate the workload in the workload file
+        with open(database.path_workload, "r", encoding="utf-8") as i_f:
+            line = i_f.readline()
+        with open(database.path_workload, "a", encoding="utf-8") as o_f:
+            o_f.write(line)
+        database = _create_tmp_database(tmpdir)
+        workload_2 = database.commit_workload(mod_2)
+        record_2 = TuningRecord(
+            _create_schedule(mod_2, lambda sch: None).trace,
+            [0.5, 0.5, 0.5],
+            workload_2,
+            tvm.target.Target("llvm"),
+            ArgInfo.from_prim_func(func=mod_2["main"]),  # pylint: disable=unsubscriptable-object
+        )
+        database.commit_tuning_record(record_2)
+        # the new workload must not collide with the old one, neither before nor after a reload
+        for reloaded in [database, _create_tmp_database(tmpdir)]:
+            (ret,) = reloaded.get_top_k(reloaded.commit_workload(mod), 3)
+            _equal_record(ret, record)
+            (ret,) = reloaded.get_top_k(reloaded.commit_workload(mod_2), 3)
+            _equal_record(ret, record_2)
+
+
 if __name__ == "__main__":
     sys.exit(pytest.main([__file__] + sys.argv[1:]))
@@ -30,7 +30,10 @@ from tvm.meta_schedule.integration import (
     MetaScheduleContext,
     TaskExtraction,
     ApplyHistoryBest,
+    normalize_and_hash_tasks,
+    normalize_module,
 )
+from tvm.meta_schedule.tune import Parse
 from tvm.meta_schedule.testing import get_network
 from tvm.script import tir as T
 
@@ -176,5 +179,43 @@ def test_meta_schedule_integration_apply_history_best():
     assert tvm.ir.structural_equal(mod, workload.mod)
 
 
+def test_meta_schedule_integration_normalize_module():
+    func = MockModule["main"]
+    # a module with "main" is returned unchanged
+    assert normalize_module(MockModule).same_as(MockModule)
+    # a single function not named "main" is renamed
+    mod = normalize_module(IRModule({"mock": func}))
+    assert [gv.name_hint for gv in mod.get_global_vars()] == ["main"]
+    tvm.ir.assert_structural_equal(mod, MockModule)
+    # multiple functions without "main" are ambiguous
+    with pytest.raises(ValueError):
+        normalize_module(IRModule({"mock_0": func, "mock_1": func}))
+
+
+def test_meta_schedule_integration_parse_mod():
+    # pylint: disable=protected-access
+    assert Parse._mod(MockModule).same_as(MockModule)
+    tvm.ir.assert_structural_equal(Parse._mod(IRModule({"mock": MockModule["main"]})), MockModule)
+    # a PrimFunc is wrapped into a module
+    mod = Parse._mod(MockModule["main"])
+    assert [gv.name_hint for gv in mod.get_global_vars()] == ["main"]
+    tvm.ir.assert_structural_equal(mod, MockModule)
+    # pylint: enable=protected-access
+
+
+def test_meta_schedule_integration_normalize_and_hash_tasks():
+    target = Target("llvm")
+    tasks = [
+        ExtractedTask("mock-0", MockModule, target, [IRModule({"mock": MockModule["main"]})]),
+        ExtractedTask("mock-1", MockModule, target, [MockModule]),
+    ]
+    results = normalize_and_hash_tasks(tasks)
+    assert len(results) == 2
+    for mod, shash in results:
+        tvm.ir.assert_structural_equal(mod, MockModule)
+        assert shash == tvm.ir.structural_hash(mod)
+    assert results[0][1] == results[1][1]
+
+
 if __name__ == "__main__":
     sys.exit(pytest.main([__file__] + sys.argv[1:]))
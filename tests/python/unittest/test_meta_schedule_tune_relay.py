@@ -16,7 +16,9 @@
 # under the License.
 # pylint: disable=missing-docstring
 import logging
+import os
 import tempfile
+from unittest import mock
 import pytest
 import numpy as np
 from typing import Tuple, List
@@ -28,14 +30,36 @@ from tvm.runtime.ndarray import cpu, cuda
 from tvm.target.target import Target
 from tvm.contrib import graph_executor
 from tvm.meta_schedule import ReplayTraceConfig
+from tvm.meta_schedule.builder import BuilderInput, BuilderResult, PyBuilder
+from tvm.meta_schedule.cost_model import RandomModel
+from tvm.meta_schedule.integration import ExtractedTask
+from tvm.meta_schedule.runner import PyRunner, RunnerFuture, RunnerInput
 from tvm.meta_schedule.database import PyDatabase, Workload, TuningRecord
 from tvm.meta_schedule.testing import MODEL_TYPE, MODEL_TYPES, get_torch_model
 from tvm.meta_schedule.tune import tune_relay
+from tvm.meta_schedule.tune import _load_tasks, _save_tasks, _tasks_cache_key
+from tvm.meta_schedule.testing import te_workload
+from tvm.te import create_prim_func
 
 logging.basicConfig()
 logging.getLogger("tvm.meta_schedule").setLevel(logging.DEBUG)
 
 
+class DummyBuilder(PyBuilder):
+    def build(self, build_inputs: List[BuilderInput]) -> List[BuilderResult]:
+        return [BuilderResult("test_path", None) for _ in build_inputs]
+
+
+class DummyRunner(PyRunner):
+    def run(self, runner_inputs: List[RunnerInput]) -> List[RunnerFuture]:
+        raise NotImplementedError
+
+
+class DummyTaskScheduler:
+    def tune(self) -> None:
+        pass
+
+
 class DummyDatabase(PyDatabase):
     def __init__(self):
         super().__init__()
@@ -142,7 +166,101 @@ def test_meta_schedule_tune_relay(model_name: str, batch_size: int, target: str)
         assert np.allclose(actual_output, expected_output, rtol=1e-4, atol=2e-4)
 
 
+def test_meta_schedule_tune_relay_task_cache():
+    data = relay.var("data", shape=(1, 16), dtype="float32")
+    relay_mod = IRModule.from_expr(relay.nn.relu(data))
+    target = Target("llvm")
+    mod = IRModule({"main": create_prim_func(te_workload.matmul(n=16, m=16, k=16))})
+    key = _tasks_cache_key(relay_mod, target, params=None)
+    with tempfile.TemporaryDirectory() as work_dir:
+        path = os.path.join(work_dir, "main_tasks.json")
+        assert _load_tasks(path, key) is None
+        _save_tasks(path, key, [("matmul", mod)])
+        ((task_name, loaded_mod),) = _load_tasks(path, key)
+        assert task_name == "matmul"
+        assert tvm.ir.structural_equal(loaded_mod, mod)
+        # a different target invalidates the cache
+        assert _load_tasks(path, _tasks_cache_key(relay_mod, Target("cuda"), params=None)) is None
+
+
+def test_meta_schedule_tune_relay_task_cache_hit():
+    data = relay.var("data", shape=(1, 16), dtype="float32")
+    relay_mod = IRModule.from_expr(relay.nn.relu(data))
+    target = Target("llvm")
+    mod = IRModule({"main": create_prim_func(te_workload.matmul(n=16, m=16, k=16))})
+    num_extractions = 0
+
+    def extract_task_from_relay(*_args, **_kwargs):
+        nonlocal num_extractions
+        num_extractions += 1
+        return [ExtractedTask("matmul", mod, target, [mod])]
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        with mock.patch(
+            "tvm.meta_schedule.tune.extract_task_from_relay", extract_task_from_relay
+        ), mock.patch("tvm.relay.build"):
+            for _ in range(2):
+                tune_relay(
+                    mod=relay_mod,
+                    target=target,
+                    config=ReplayTraceConfig(num_trials_per_iter=1, num_trials_total=1),
+                    work_dir=work_dir,
+                    builder=DummyBuilder(),
+                    runner=DummyRunner(),
+                    database=DummyDatabase(),
+                    cost_model=RandomModel(),
+                    task_scheduler=lambda *_args: DummyTaskScheduler(),
+                    cache_tasks=True,
+                )
+        assert num_extractions == 1
+
+
+def test_meta_schedule_tune_relay_task_dedup():
+    data = relay.var("data", shape=(1, 16), dtype="float32")
+    relay_mod = IRModule.from_expr(relay.nn.relu(data))
+    target = Target("llvm")
+    mod = IRModule({"main": create_prim_func(te_workload.matmul(n=16, m=16, k=16))})
+    # structurally equal to `mod` after its function is renamed to "main"
+    mod_dup = IRModule({"matmul": create_prim_func(te_workload.matmul(n=16, m=16, k=16))})
+    mod_other = IRModule({"main": create_prim_func(te_workload.matmul(n=32, m=32, k=32))})
+    scheduled_tasks = []
+
+    def extract_task_from_relay(*_args, **_kwargs):
+        return [
+            ExtractedTask("matmul_0", mod, target, [mod]),
+            ExtractedTask("matmul_1", mod_dup, target, [mod_dup]),
+            ExtractedTask("matmul_2", mod_other, target, [mod_other]),
+        ]
+
+    def task_scheduler(tasks, *_args):
+        scheduled_tasks.extend(tasks)
+        return DummyTaskScheduler()
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        with mock.patch(
+            "tvm.meta_schedule.tune.extract_task_from_relay", extract_task_from_relay
+        ), mock.patch("tvm.relay.build"):
+            tune_relay(
+                mod=relay_mod,
+                target=target,
+                config=ReplayTraceConfig(num_trials_per_iter=1, num_trials_total=1),
+                work_dir=work_dir,
+                builder=DummyBuilder(),
+                runner=DummyRunner(),
+                database=DummyDatabase(),
+                cost_model=RandomModel(),
+                task_scheduler=task_scheduler,
+            )
+    # the duplicate is dropped and its first occurrence is kept
+    assert [task.task_name for task in scheduled_tasks] == ["matmul_0", "matmul_2"]
+    assert tvm.ir.structural_equal(scheduled_tasks[0].mod, mod)
+    assert tvm.ir.structural_equal(scheduled_tasks[1].mod, mod_other)
+
+
 if __name__ == """__main__""":
+    test_meta_schedule_tune_relay_task_cache()
+    test_meta_schedule_tune_relay_task_cache_hit()
+    test_meta_schedule_tune_relay_task_dedup()
     test_meta_schedule_tune_relay("resnet18", 1, "llvm --num-cores=16")
     test_meta_schedule_tune_relay("resnet18", 1, "nvidia/geforce-rtx-3070")
     test_meta_schedule_tune_relay("mobilenet_v2", 1, "llvm --num-cores=16")
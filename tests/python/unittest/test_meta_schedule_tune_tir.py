@@ -16,11 +16,20 @@
 # under the License.
 # pylint: disable=missing-docstring
 import logging
+import os
 import tempfile
+from typing import Dict, List
 
 import tvm
 import pytest
+from tvm.ir import IRModule
 from tvm.meta_schedule import ReplayTraceConfig, tune_tir
+from tvm.meta_schedule.arg_info import ArgInfo
+from tvm.meta_schedule.builder import BuilderInput, BuilderResult, PyBuilder
+from tvm.meta_schedule.database import PyDatabase, TuningRecord, Workload
+from tvm.meta_schedule.postproc import PyPostproc
+from tvm.meta_schedule.runner import PyRunner, RunnerFuture, RunnerInput, RunnerResult
+from tvm.meta_schedule.tune import Parse, _droplet_refine, _neighbor_decisions, shutdown_defaults
 from tvm.meta_schedule.tune_context import TuneContext
 from tvm.meta_schedule import schedule_rule, postproc
 from tvm.meta_schedule.space_generator import PostOrderApply
@@ -53,6 +62,101 @@ def matmul(a: T.handle, b: T.handle, c: T.handle) -> None:
 # pylint: enable=no-member,invalid-name,unused-variable
 
 
+class DummyRunnerFuture(RunnerFuture):
+    def __init__(self, cost: float):
+        super().__init__()
+        self.cost = cost
+
+    def done(self) -> bool:
+        return True
+
+    def result(self) -> RunnerResult:
+        return RunnerResult([self.cost], None)
+
+
+class DummyBuilder(PyBuilder):
+    def __init__(self):
+        super().__init__()
+        self.mod_hashes: Dict[str, int] = {}
+
+    def build(self, build_inputs: List[BuilderInput]) -> List[BuilderResult]:
+        results = []
+        for build_input in build_inputs:
+            artifact_path = os.path.join(tempfile.mkdtemp(), "tvm_tmp_mod.tar")
+            self.mod_hashes[artifact_path] = tvm.ir.structural_hash(build_input.mod)
+            results.append(BuilderResult(artifact_path, None))
+        return results
+
+
+class DummyRunner(PyRunner):
+    def __init__(self, builder: DummyBuilder, costs: Dict[int, float]):
+        super().__init__()
+        self.builder = builder
+        self.costs = costs
+
+    def run(self, runner_inputs: List[RunnerInput]) -> List[RunnerFuture]:
+        return [
+            DummyRunnerFuture(self.costs.get(self.builder.mod_hashes[x.artifact_path], 2.0))
+            for x in runner_inputs
+        ]
+
+
+class DummyDatabase(PyDatabase):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+        self.workload_reg = []
+
+    def has_workload(self, mod: IRModule) -> bool:
+        for workload in self.workload_reg:
+            if tvm.ir.structural_equal(workload.mod, mod):
+                return True
+        return False
+
+    def commit_tuning_record(self, record: TuningRecord) -> None:
+        self.records.append(record)
+
+    def commit_workload(self, mod: IRModule) -> Workload:
+        for workload in self.workload_reg:
+            if tvm.ir.structural_equal(workload.mod, mod):
+                return workload
+        workload = Workload(mod)
+        self.workload_reg.append(workload)
+        return workload
+
+    def get_top_k(self, workload: Workload, top_k: int) -> List[TuningRecord]:
+        return list(
+            filter(
+                lambda x: x.workload == workload,
+                sorted(self.records, key=lambda x: sum(x.run_secs) / len(x.run_secs)),
+            )
+        )[: int(top_k)]
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+
+class FailingPostproc(PyPostproc):
+    def __init__(self):
+        super().__init__()
+        self.num_applied = 0
+
+    def initialize_with_tune_context(self, context: TuneContext) -> None:
+        pass
+
+    def apply(self, sch: Schedule) -> bool:
+        self.num_applied += 1
+        return False
+
+
+def _tile_matmul(decision: List[int]) -> Schedule:
+    sch = Schedule(matmul)
+    i, _, _ = sch.get_loops(sch.get_block("update"))
+    tiles = sch.sample_perfect_tile(i, n=2, max_innermost_factor=16, decision=decision)
+    sch.split(i, factors=tiles)
+    return sch
+
+
 @pytest.mark.skip("Integration test")
 def test_tune_matmul_cpu():
     with tempfile.TemporaryDirectory() as work_dir:
@@ -212,7 +316,88 @@ def test_tune_matmul_cuda_tensor_core():
                 )
 
 
+def test_neighbor_decisions_perfect_tile():
+    sch = Schedule(matmul)
+    i, _, _ = sch.get_loops(sch.get_block("update"))
+    sch.sample_perfect_tile(i, n=3, max_innermost_factor=16, decision=[4, 2, 16])
+    ((inst, decision),) = sch.trace.decisions.items()
+    neighbors = _neighbor_decisions(inst, decision)
+    assert [2, 4, 16] in neighbors
+    assert [2, 2, 32] not in neighbors  # exceeds max_innermost_factor
+    for tiles in neighbors:
+        assert tiles[0] * tiles[1] * tiles[2] == 128
+        assert tiles[2] <= 16
+
+
+def test_neighbor_decisions_categorical():
+    sch = Schedule(matmul)
+    sch.sample_categorical(candidates=[1, 2, 4, 8], probs=[0.25, 0.25, 0.25, 0.25], decision=0)
+    ((inst, decision),) = sch.trace.decisions.items()
+    assert _neighbor_decisions(inst, decision) == [1]
+    sch = Schedule(matmul)
+    sch.sample_categorical(candidates=[1, 2, 4, 8], probs=[0.25, 0.25, 0.25, 0.25], decision=2)
+    ((inst, decision),) = sch.trace.decisions.items()
+    assert _neighbor_decisions(inst, decision) == [1, 3]
+
+
+def test_droplet_refine():
+    target = Target("llvm")
+    context = TuneContext(mod=matmul, target=target, postprocs=[])
+    database = DummyDatabase()
+    workload = database.commit_workload(context.mod)
+    args_info = ArgInfo.from_prim_func(matmul)
+    start = _tile_matmul([16, 8])
+    database.commit_tuning_record(TuningRecord(start.trace, [1.0], workload, target, args_info))
+    # only one neighbor of the starting point is faster
+    faster = _tile_matmul([32, 4])
+    builder = DummyBuilder()
+    runner = DummyRunner(builder, {tvm.ir.structural_hash(faster.mod): 0.5})
+    _droplet_refine(context, builder, runner, database, top_k=1, max_rounds=4)
+    # [8, 16] and [32, 4] in the first round, then only [64, 2], since [16, 8] is visited
+    assert len(database) == 4
+    (best,) = database.get_top_k(workload, 1)
+    assert [float(sec) for sec in best.run_secs] == [0.5]
+    ((_, decision),) = best.trace.decisions.items()
+    assert [int(factor) for factor in decision] == [32, 4]
+
+
+def test_shared_default_builder_runner():
+    # pylint: disable=protected-access
+    builder = Parse._builder(None)
+    runner = Parse._runner(None)
+    assert Parse._builder(None) is builder
+    assert Parse._runner(None) is runner
+    shutdown_defaults()
+    assert Parse._builder(None) is not builder
+    assert Parse._runner(None) is not runner
+    shutdown_defaults()
+    # pylint: enable=protected-access
+
+
+def test_droplet_refine_skips_unreplayable_record():
+    target = Target("llvm")
+    postproc = FailingPostproc()
+    context = TuneContext(mod=matmul, target=target, postprocs=[postproc])
+    database = DummyDatabase()
+    workload = database.commit_workload(context.mod)
+    args_info = ArgInfo.from_prim_func(matmul)
+    start = _tile_matmul([16, 8])
+    database.commit_tuning_record(TuningRecord(start.trace, [1.0], workload, target, args_info))
+    builder = DummyBuilder()
+    runner = DummyRunner(builder, {})
+    _droplet_refine(context, builder, runner, database, top_k=1, max_rounds=4)
+    # only the record itself is replayed, none of its neighbors
+    assert postproc.num_applied == 1
+    assert not builder.mod_hashes
+    assert len(database) == 1
+
+
 if __name__ == """__main__""":
+    test_neighbor_decisions_perfect_tile()
+    test_neighbor_decisions_categorical()
+    test_droplet_refine()
+    test_droplet_refine_skips_unreplayable_record()
+    test_shared_default_builder_runner()
     test_tune_matmul_cpu()
     test_tune_matmul_cuda()
     test_tune_matmul_cuda_tensor_core()